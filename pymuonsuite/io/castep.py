@@ -213,11 +213,7 @@ class ReadWriteCastep(ReadWrite):
                 force_write=True,
             )
 
-            if self.script is not None:
-                stxt = open(self.script).read()
-                stxt = stxt.format(seedname=sname)
-                with open(os.path.join(folder, "script.sh"), "w") as sf:
-                    sf.write(stxt)
+            self._write_script(folder, sname)
         else:
             raise (
                 NotImplementedError(
@@ -605,9 +601,9 @@ def parse_hyperfine_magres(infile):
     |   mgr (ASE Magres object): Object containing .magres hyperfine data
     """
 
-    file = open(infile, "r")
     # First, `simply parse the magres file via ASE
-    mgr = read_magres(file, True)
+    with open(infile, "r") as file:
+        mgr = read_magres(file, True)
 
     # Now go for the magres_old block
 
@@ -618,11 +614,11 @@ def parse_hyperfine_magres(infile):
 
     labels, indices = mgr.get_array("labels"), mgr.get_array("indices")
 
-    hfine_array = []
-    for lb, i in zip(labels, indices):
-        hfine_array.append(hfine[lb][i])
+    hfine_array = np.empty((len(labels), 3, 3))
+    for k, (lb, i) in enumerate(zip(labels, indices)):
+        hfine_array[k] = hfine[lb][i]
 
-    mgr.new_array("hyperfine", np.array(hfine_array))
+    mgr.new_array("hyperfine", hfine_array)
 
     return mgr
 
@@ -235,11 +235,7 @@ class ReadWriteDFTB(ReadWrite):
             a.calc.directory = folder
             a.calc.write_input(a)
 
-            if self.script is not None:
-                stxt = open(self.script).read()
-                stxt = stxt.format(seedname=sname)
-                with open(os.path.join(folder, "script.sh"), "w") as sf:
-                    sf.write(stxt)
+            self._write_script(folder, sname)
         else:
             raise (
                 NotImplementedError(
@@ -30,7 +30,7 @@ def write_tensors(tensors, filename, symbols):
     | Returns: Nothing
     """
     tensfile = open(filename, "w")
-    for i in range(np.size(tensors, 0)):
+    for i in range(len(tensors)):
         tensfile.write("{0} {1}\n".format(symbols[i], i))
         tensfile.write(
             "\n".join(["\t".join([str(x) for x in ln]) for ln in tensors[i]]) + "\n"
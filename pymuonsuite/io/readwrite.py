@@ -3,6 +3,8 @@
 Author: Laura Murgatroyd
 """
 
+import os
+
 
 class ReadWrite(object):
     def __init__(self, params={}, script=None, calc=None):
@@ -55,3 +57,26 @@ class ReadWrite(object):
         |                           be appropriately replaced.
         """
         self.script = script
+
+    @property
+    def script(self):
+        return self._script
+
+    @script.setter
+    def script(self, script):
+        self._script = script
+        # The template is read lazily, then reused for every structure written
+        self._script_template = None
+
+    def _write_script(self, folder, sname):
+        """Write the submission script, if any, to folder/script.sh with
+        {seedname} replaced by sname. The script file is only read from disk
+        the first time it is needed.
+        """
+        if self.script is None:
+            return
+        if self._script_template is None:
+            with open(self.script) as sf:
+                self._script_template = sf.read()
+        with open(os.path.join(folder, "script.sh"), "w") as sf:
+            sf.write(self._script_template.format(seedname=sname))
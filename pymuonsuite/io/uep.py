@@ -47,11 +47,7 @@ class ReadWriteUEP(ReadWrite):
             raise
             return
 
-        if self.script is not None:
-            stxt = open(self.script).read()
-            stxt = stxt.format(seedname=sname)
-            with open(os.path.join(folder, "script.sh"), "w") as sf:
-                sf.write(stxt)
+        self._write_script(folder, sname)
 
     def _create_calculator(self, a, folder, sname):
         params = self.params
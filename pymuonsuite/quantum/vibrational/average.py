@@ -39,7 +39,7 @@ def muon_vibrational_average_write(
     displace_T=0,
     phonon_source_file=None,
     phonon_source_type="castep",
-    **kwargs
+    **kwargs,
 ):
     """
     Write input files to compute a vibrational average for a quantity on a muon
@@ -150,7 +150,7 @@ def muon_vibrational_average_write(
         dcell.set_positions(pos + d)
         if calculator == "dftb" and not kwargs["dftb_pbc"]:
             dcell.set_pbc(False)
-        dcell.info["name"] = sname + "_displaced_{0}".format(i)
+        dcell.info["name"] = f"{sname}_displaced_{i}"
         displaced_cells.append(dcell)
 
     if kwargs["write_allconf"]:
@@ -197,7 +197,7 @@ def muon_vibrational_average_read(
     avgprop="hyperfine",
     average_T=0,
     average_file="averages.dat",
-    **kwargs
+    **kwargs,
 ):
     # Open the structure file
     sname = seedname(structure)
@@ -218,22 +218,24 @@ def muon_vibrational_average_read(
     mu_i = displaced_coll.info["muon_index"]
     displsch = displaced_coll.info["displacement_scheme"]
 
-    to_avg = []
+    N = len(displaced_coll)
+    if avgprop == "hyperfine":
+        to_avg = np.empty((N, 3, 3))
+    elif avgprop == "charge":
+        to_avg = np.empty(N)
 
-    for a in displaced_coll:
+    for k, a in enumerate(displaced_coll):
         if avgprop == "hyperfine":
-            to_avg.append(a.get_array("hyperfine")[mu_i])
+            to_avg[k] = a.get_array("hyperfine")[mu_i]
         elif avgprop == "charge":
             # Used mostly as test
             try:
-                to_avg.append(a.get_charges()[mu_i])
+                to_avg[k] = a.get_charges()[mu_i]
             except RuntimeError:
                 raise (IOError("Could not read charges."))
 
-    to_avg = np.array(to_avg)
     displsch.recalc_weights(T=average_T)
     # New shape
-    N = len(displaced_coll)
     shape = tuple([slice(N)] + [None] * (len(to_avg.shape) - 1))
     weights = displsch.weights[shape]
     avg = np.sum(weights * to_avg, axis=0)
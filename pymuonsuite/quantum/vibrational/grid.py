@@ -3,11 +3,11 @@ Author: Simone Sturniolo and Adam Laverack
 """
 
 
-import random
-
 import numpy as np
 from soprano.collection.generate import linspaceGen
 
+_RNG = np.random.default_rng()
+
 
 # def calc_wavefunction(sigmas, grid_n, sigmaN=3):
 #     """
@@ -89,7 +89,7 @@ def displaced_cell_range(cell, a_i, grid_n, disp):
     return lg
 
 
-def tl_disp_generator(norm_coords, evecs, num_atoms):
+def tl_disp_generator(norm_coords, evecs, num_atoms, seed=None):
     """
     Calculate a set of displacements of atoms in a system by generating a set of
     random thermal lines at T=0.
@@ -101,23 +101,25 @@ def tl_disp_generator(norm_coords, evecs, num_atoms):
     |       the eigenvectors of all real phonon modes for each atom in the
     |       system in the format evecs[modes][atoms].
     |   num_atoms(int): Number of atoms in the system.
+    |   seed(int): Seed for the random signs of the thermal line. If None
+    |       (default), a module-wide random generator is used.
     |
     | Returns:
     |   displacements(Numpy float array(num_atoms, 3)): Array containing the
     |       appropriate displacements of atoms for a randomly generated thermal
     |       line.
     """
-    displacements = np.zeros((num_atoms, 3))
-    coefficients = np.zeros(np.size(norm_coords, 1))
-    for i in range(np.size(coefficients)):
-        coefficients[i] = random.choice([-1, 1])
-    norm_coords = norm_coords * coefficients
-
-    for atom in range(num_atoms):
-        for mode in range(np.size(norm_coords, 1)):
-            displacements[atom] += (
-                norm_coords[atom][mode] * evecs[mode][atom].real * 1e10
-            )
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    coefficients = rng.integers(0, 2, size=norm_coords.shape[1]) * 2 - 1
+
+    # Sum over modes of the randomly signed displacement along each eigenvector
+    displacements = np.einsum(
+        "am,m,man->an",
+        norm_coords[:num_atoms],
+        coefficients,
+        np.real(evecs)[:, :num_atoms],
+    )
+    displacements *= 1e10
 
     return displacements
 
@@ -140,13 +142,7 @@ def weighted_tens_avg(tensors, weight):
     |   tens_avg(Numpy float array, shape:(Atoms,x,y)): The averaged tensor for
     |       each atom.
     """
-    num_atoms = np.size(tensors, 1)
-    x = np.size(tensors, 2)
-    y = np.size(tensors, 3)
-    tens_avg = np.zeros((num_atoms, x, y))
-    tensors = tensors * weight[:, None, None, None]
-    for i in range(num_atoms):
-        tens_avg[i] = np.sum(tensors[:, i], axis=0) / np.sum(weight)
+    tens_avg = np.einsum("n,naij->aij", weight, tensors) / np.sum(weight)
     return tens_avg
 
 
@@ -168,10 +164,8 @@ def wf_disp_generator(disp_factor, maj_evecs, grid_n):
     |       <grid_n> elements are for the first mode, the second <grid_n> for
     |       the second mode, etc.
     """
-    displacements = np.zeros((grid_n * 3, 3))
     max_disp = 3 * maj_evecs * disp_factor[:, None]
-    for mode in range(3):
-        for n, t in enumerate(np.linspace(-1, 1, grid_n)):
-            displacements[n + mode * grid_n] = t * max_disp[mode]
+    t = np.linspace(-1, 1, grid_n)
+    displacements = (t[None, :, None] * max_disp[:, None, :]).reshape(-1, 3)
 
     return displacements
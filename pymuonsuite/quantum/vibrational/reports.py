@@ -25,19 +25,25 @@ def harm_potential_report(R, grid_n, mass, freqs, E_table, filename):
     |
     | Returns: Nothing
     """
-    R_axes = np.array([np.linspace(-3 * Ri, 3 * Ri, grid_n) for Ri in R])
+    R_axes = np.asarray(R)[:, None] * np.linspace(-3, 3, grid_n)[None, :]
+    n_axes = len(R_axes)
+    # Output columns: displacements, harmonic potential, measured energies
+    all_table = np.empty((grid_n, 2 * n_axes + E_table.shape[0]))
+    all_table[:, :n_axes] = R_axes.T
     # Now the potential, measured vs. theoretical
     harm_K = mass * freqs ** 2
-    harm_V = (0.5 * harm_K[:, None] * (R_axes * 1e-10) ** 2) / cnst.electron_volt
-    # Normalise E_table
+    all_table[:, n_axes : 2 * n_axes] = (
+        0.5 * harm_K * (R_axes.T * 1e-10) ** 2
+    ) / cnst.electron_volt
+    # Normalise E_table to the central point, writing straight into the
+    # output so that the caller's table is left untouched
+    c = E_table.shape[1] // 2
     if E_table.shape[1] % 2 == 1:
-        E_table -= (E_table[:, E_table.shape[1] // 2])[:, None]
+        E0 = E_table[:, c]
     else:
-        E_table -= (
-            E_table[:, E_table.shape[1] // 2] + E_table[:, E_table.shape[1] // 2 - 1]
-        )[:, None] / 2.0
-    all_table = np.concatenate((R_axes, harm_V, E_table), axis=0)
-    np.savetxt(filename, all_table.T)
+        E0 = (E_table[:, c] + E_table[:, c - 1]) / 2.0
+    np.subtract(E_table.T, E0, out=all_table[:, 2 * n_axes :])
+    np.savetxt(filename, all_table)
 
 
 def hfine_report(total_grid_n, tensors, hfine_tens_avg, weight, filename, atoms):
@@ -61,30 +67,34 @@ def hfine_report(total_grid_n, tensors, hfine_tens_avg, weight, filename, atoms)
     | Returns:
     |   Nothing
     """
-    ofile = open(filename, "w")
-    for index in atoms:
-        hfine_table = np.trace(tensors[:, index], axis1=1, axis2=2) / 3
-        hfine_avg = np.sum(weight * hfine_table) / np.sum(weight)
-        ofile.write(
-            "Predicted hyperfine coupling on labeled atom ({1}): {0} MHz\n".format(
-                hfine_avg, atoms[index]
-            )
-        )
+    # Isotropic couplings for all atoms at all grid points, then averaged
+    hfine_table = np.trace(tensors, axis1=2, axis2=3) / 3
+    hfine_avg = np.dot(weight, hfine_table) / np.sum(weight)
 
-        evals, evecs = np.linalg.eigh(hfine_tens_avg[index])
-        evals, evecs = zip(*sorted(zip(evals, evecs), key=lambda x: abs(x[0])))
-        evals_notr = -np.array(evals) + np.average(evals)
+    # Dipolar components for all atoms, from eigenvalues sorted by magnitude
+    evals = np.linalg.eigvalsh(hfine_tens_avg)
+    order = np.argsort(np.abs(evals), axis=-1, kind="stable")
+    evals = np.take_along_axis(evals, order, axis=-1)
+    evals_notr = -evals + np.average(evals, axis=-1)[:, None]
 
-        if abs(evals_notr[2]) > abs(evals_notr[0]):
-            D1 = evals_notr[2]
-            D2 = evals_notr[1] - evals_notr[0]
-        else:
-            D1 = evals_notr[0]
-            D2 = evals_notr[2] - evals_notr[1]
+    largest_last = np.abs(evals_notr[:, 2]) > np.abs(evals_notr[:, 0])
+    D1 = np.where(largest_last, evals_notr[:, 2], evals_notr[:, 0])
+    D2 = np.where(
+        largest_last,
+        evals_notr[:, 1] - evals_notr[:, 0],
+        evals_notr[:, 2] - evals_notr[:, 1],
+    )
 
-        ofile.write(
+    report = "".join(
+        [
             (
-                "Predicted dipolar hyperfine components on labeled atom ({2}):\n"
-                "D1:\t{0} MHz\nD2:\t{1} MHz\n"
-            ).format(D1, D2, atoms[index])
-        )
+                "Predicted hyperfine coupling on labeled atom ({1}): {0} MHz\n"
+                "Predicted dipolar hyperfine components on labeled atom ({1}):\n"
+                "D1:\t{2} MHz\nD2:\t{3} MHz\n"
+            ).format(hfine_avg[index], atoms[index], D1[index], D2[index])
+            for index in atoms
+        ]
+    )
+
+    with open(filename, "w") as ofile:
+        ofile.write(report)
@@ -1,6 +1,9 @@
 """Tests for quantum averaging methods"""
 
 
+import os
+import re
+import tempfile
 import unittest
 import numpy as np
 import scipy.constants as cnst
@@ -13,6 +16,11 @@ from pymuonsuite.quantum.vibrational.harmonic import (
     harmonic_rho,
     harmonic_rho_sum,
 )
+from pymuonsuite.quantum.vibrational.grid import (
+    tl_disp_generator,
+    weighted_tens_avg,
+)
+from pymuonsuite.quantum.vibrational.reports import hfine_report
 
 
 class TestDisplacements(unittest.TestCase):
@@ -158,6 +166,75 @@ class TestDisplacements(unittest.TestCase):
 
         self.assertSmallRelativeError(avgvol, avgdisplRW, 1e-1)
 
+    def testThermalLine(self):
+
+        num_atoms = 4
+        num_modes = 12
+        rng = np.random.default_rng(0)
+        norm_coords = rng.random((num_atoms, num_modes))
+        evecs = rng.random((num_modes, num_atoms, 3)) + 1.0j * rng.random(
+            (num_modes, num_atoms, 3)
+        )
+
+        # Same seed, same thermal line
+        displ = tl_disp_generator(norm_coords, evecs, num_atoms, seed=42)
+        self.assertTrue(
+            np.array_equal(
+                displ, tl_disp_generator(norm_coords, evecs, num_atoms, seed=42)
+            )
+        )
+
+        # Compare with explicit sum over modes
+        c = np.random.default_rng(42).integers(0, 2, size=num_modes) * 2 - 1
+        expected = np.zeros((num_atoms, 3))
+        for a in range(num_atoms):
+            for m in range(num_modes):
+                expected[a] += norm_coords[a, m] * c[m] * evecs[m, a].real * 1e10
+        self.assertTrue(np.allclose(displ, expected))
+
+        # Only the first num_atoms atoms are displaced
+        displ = tl_disp_generator(norm_coords, evecs, 2, seed=42)
+        self.assertEqual(displ.shape, (2, 3))
+        self.assertTrue(np.allclose(displ, expected[:2]))
+
+
+class TestReports(unittest.TestCase):
+    def testHfineReport(self):
+
+        # Rotate diagonal tensors so they are not trivially sorted
+        th = 0.3
+        rot = np.array(
+            [
+                [np.cos(th), -np.sin(th), 0],
+                [np.sin(th), np.cos(th), 0],
+                [0, 0, 1],
+            ]
+        )
+        # Eigenvalues sorted by magnitude: (1, 2, -6) and (1, 5, 6).
+        # Traceless parts: (-2, -3, 5), largest in the last component, and
+        # (3, -1, -2), largest in the first one
+        diags = np.array([[-6.0, 1.0, 2.0], [1.0, 5.0, 6.0]])
+        tens = np.array([rot @ np.diag(d) @ rot.T for d in diags])
+
+        # Two grid points; the weighted average shifts the trace by one
+        tensors = np.array([tens, tens + 3 * np.eye(3)[None]])
+        weight = np.array([2.0, 1.0])
+        tens_avg = weighted_tens_avg(tensors, weight)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "hfine_report.txt")
+            hfine_report(2, tensors, tens_avg, weight, fname, {0: "H", 1: "C"})
+            with open(fname) as f:
+                report = f.read()
+
+        iso = [float(x) for x in re.findall(r"\((?:H|C)\): (\S+) MHz", report)]
+        D1 = [float(x) for x in re.findall(r"D1:\t(\S+) MHz", report)]
+        D2 = [float(x) for x in re.findall(r"D2:\t(\S+) MHz", report)]
+
+        self.assertTrue(np.allclose(iso, [0.0, 5.0]))
+        self.assertTrue(np.allclose(D1, [5.0, 3.0]))
+        self.assertTrue(np.allclose(D2, [-1.0, -1.0]))
+
 
 if __name__ == "__main__":
 